@@ -0,0 +1,18 @@
+"""
+Configuración de gunicorn para producción
+Lanza varios workers de uvicorn para aprovechar todos los cores
+
+Uso: gunicorn main:app -c gunicorn_conf.py
+"""
+
+import multiprocessing
+import os
+
+# Workers: WEB_CONCURRENCY si está definido, si no 2 * CPU + 1
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+bind = f"0.0.0.0:{os.getenv('PORT', 8000)}"
+
+# Heartbeat en memoria para no bloquear en discos lentos
+worker_tmp_dir = "/dev/shm"
@@ -0,0 +1,7 @@
+"""
+Backend API para Pokemon TCG Trader
+"""
+
+from .app import app
+
+__all__ = ["app"]
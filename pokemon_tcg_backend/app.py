@@ -0,0 +1,109 @@
+"""
+Backend API para Pokemon TCG Trader
+Conecta Lovable con la API de Pokemon TCG
+"""
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+from typing import Any
+import anyio
+import httpx
+import orjson
+import redis.asyncio as redis
+
+from .config import BASE_URL, HEADERS, LOVABLE_ORIGIN, REDIS_URL, UPSTREAM_RATE_LIMIT
+from .routers import cards, search, sets, trending
+from .upstream import UpstreamTransport
+
+# Hilos máximos del threadpool de anyio (por defecto son 40)
+THREADPOOL_SIZE = 100
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Crea el cliente HTTP y la conexión a Redis compartidos por toda la app"""
+    # Threadpool más grande para el trabajo que se saca del event loop
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
+    app.state.redis = redis.from_url(REDIS_URL)
+    # Pool de conexiones persistente con HTTP/2: los handshakes TCP+TLS se
+    # reutilizan y las peticiones paralelas comparten conexión
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=30
+        )
+    )
+    app.state.client = httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers=HEADERS,
+        timeout=10,
+        transport=UpstreamTransport(transport, max_rate=UPSTREAM_RATE_LIMIT)
+    )
+    try:
+        yield
+    finally:
+        await app.state.client.aclose()
+        await app.state.redis.aclose()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse serializada con orjson (mucho más rápido que json en payloads grandes)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Crear app FastAPI
+app = FastAPI(
+    title="Pokemon TCG Trader Backend",
+    description="API para servir datos a Lovable",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Configurar CORS para que Lovable pueda acceder
+# La API es solo de lectura y sin cookies, así que no hacen falta credenciales;
+# max_age deja que el navegador cachee el preflight un día
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[LOVABLE_ORIGIN],
+    allow_credentials=False,
+    allow_methods=["GET"],
+    allow_headers=["*"],
+    max_age=86400,
+)
+
+# Comprimir respuestas grandes (p.ej. /api/set/{id}); se añade después de CORS
+# para que sea el middleware más externo
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+app.include_router(search.router)
+app.include_router(cards.router)
+app.include_router(trending.router)
+app.include_router(sets.router)
+
+
+# ============= ENDPOINTS =============
+
+@app.get("/")
+def root():
+    """Endpoint de prueba"""
+    return {
+        "message": "Pokemon TCG Trader API",
+        "status": "online",
+        "endpoints": {
+            "search": "/api/search?q=charizard",
+            "search_light": "/api/search?q=charizard&enrich=false&fields=id,name,images",
+            "card": "/api/card/{id}",
+            "trending": "/api/trending",
+            "set": "/api/set/{id}",
+            "sets": "/api/sets"
+        }
+    }
@@ -0,0 +1,94 @@
+"""
+Cache en Redis para las respuestas de la API
+"""
+
+from typing import Dict
+import asyncio
+import httpx
+import orjson
+import redis.asyncio as redis
+import time
+
+from .upstream import UpstreamError
+
+# Cache en Redis (compartido entre workers y réplicas)
+# Las entradas se guardan más tiempo que su TTL para poder servirlas como
+# "stale" si la API de Pokemon TCG falla
+STALE_DURATION = 7 * 86400  # 1 semana
+
+
+# Peticiones en curso por clave (single-flight): si varias peticiones fallan
+# el cache a la vez, solo una llama a la API y el resto espera su resultado
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+class _LeaderCancelled(Exception):
+    """La petición que hacía el fetch se canceló; los que esperaban deben reintentar"""
+
+
+async def cached(redis_client: redis.Redis, cache_key: str, ttl: int, fetch_function):
+    """
+    Helper para manejar cache
+    Devuelve (data, estado) donde estado es HIT, MISS o STALE
+    """
+    stored = None
+    try:
+        raw = await redis_client.get(cache_key)
+        if raw:
+            stored = orjson.loads(raw)
+            if time.time() - stored['timestamp'] < ttl:
+                return stored['data'], "HIT"
+    except redis.RedisError:
+        pass
+    
+    # Si ya hay alguien pidiendo esta clave, esperar a su resultado
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except _LeaderCancelled:
+            # El cliente que pedía los datos se fue: tomar el relevo
+            return await cached(redis_client, cache_key, ttl, fetch_function)
+    
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    try:
+        result = await _fetch_and_store(redis_client, cache_key, fetch_function, stored)
+    except asyncio.CancelledError:
+        # No propagar la cancelación a los demás: solo se ha ido este cliente
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Marcar la excepción como recuperada aunque nadie más estuviera esperando
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[cache_key]
+
+
+async def _fetch_and_store(redis_client: redis.Redis, cache_key: str, fetch_function, stored):
+    """Pide los datos a la API y los guarda en Redis (con fallback a stale)"""
+    # Fetch new data
+    try:
+        data = await fetch_function()
+    except (httpx.TransportError, UpstreamError):
+        # Si la API falla, devolver el último valor guardado
+        if stored is not None:
+            return stored['data'], "STALE"
+        raise
+    
+    if data is not None:
+        try:
+            await redis_client.set(
+                cache_key,
+                orjson.dumps({'data': data, 'timestamp': time.time()}),
+                ex=STALE_DURATION
+            )
+        except redis.RedisError:
+            pass
+    return data, "MISS"
@@ -0,0 +1,20 @@
+"""
+Configuración del backend (variables de entorno)
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Cargar variables de entorno
+load_dotenv()
+
+API_KEY = os.getenv('POKEMON_TCG_API_KEY')
+BASE_URL = "https://api.pokemontcg.io/v2"
+HEADERS = {'X-Api-Key': API_KEY} if API_KEY else {}
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# Origen de la app de Lovable (único origen permitido por CORS)
+LOVABLE_ORIGIN = os.getenv('LOVABLE_ORIGIN', 'https://app.lovable.dev')
+
+# Peticiones por segundo máximas a la API de Pokemon TCG (por worker)
+UPSTREAM_RATE_LIMIT = float(os.getenv('UPSTREAM_RATE_LIMIT', 20))
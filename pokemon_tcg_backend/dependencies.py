@@ -0,0 +1,17 @@
+"""
+Dependencias de FastAPI para acceder a los clientes compartidos de la app
+"""
+
+from fastapi import Request
+import httpx
+import redis.asyncio as redis
+
+
+def get_client(request: Request) -> httpx.AsyncClient:
+    """Cliente HTTP de la API de Pokemon TCG (creado en el lifespan)"""
+    return request.app.state.client
+
+
+def get_redis(request: Request) -> redis.Redis:
+    """Conexión a Redis (creada en el lifespan)"""
+    return request.app.state.redis
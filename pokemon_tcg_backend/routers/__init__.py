@@ -0,0 +1,3 @@
+"""
+Routers de la API
+"""
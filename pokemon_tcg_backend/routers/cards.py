@@ -0,0 +1,120 @@
+"""
+Endpoints de detalle de carta y cartas relacionadas
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+import asyncio
+import httpx
+import orjson
+import redis.asyncio as redis
+
+from ..cache import cached
+from ..dependencies import get_client, get_redis
+from ..enrichment import (
+    extract_market_price,
+    extract_all_prices,
+    calculate_pull_rate,
+    calculate_trend,
+    calculate_investment,
+    get_related_cards_ids,
+    format_related_card
+)
+from ..upstream import fetch_optional, raise_for_upstream
+
+router = APIRouter()
+
+
+@router.get("/api/card/{card_id}")
+async def get_card_detail(
+    card_id: str,
+    response: Response,
+    client: httpx.AsyncClient = Depends(get_client),
+    redis_client: redis.Redis = Depends(get_redis)
+):
+    """Obtener detalles de una carta específica con datos enriquecidos"""
+    try:
+        # Intentar cache primero
+        cache_key = f"card:{card_id}"
+        
+        async def fetch_card():
+            card_response = await client.get(f"/cards/{card_id}")
+            if card_response.status_code == 200:
+                return orjson.loads(card_response.content)['data']
+            raise_for_upstream(card_response)
+            return None
+        
+        card, cache_status = await cached(redis_client, cache_key, 3600, fetch_card)
+        response.headers['X-Cache'] = cache_status
+        
+        if not card:
+            raise HTTPException(status_code=404, detail="Card not found")
+        
+        # Enriquecer datos
+        enriched = {
+            **card,
+            "market_price": extract_market_price(card),
+            "all_prices": extract_all_prices(card),
+            "pull_rate": calculate_pull_rate(card),
+            "price_trend": calculate_trend(card),
+            "investment_analysis": calculate_investment(card),
+            "related_cards": get_related_cards_ids(card)
+        }
+        
+        return {"success": True, "data": enriched}
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/related/{card_id}")
+async def get_related_cards(
+    card_id: str,
+    limit: int = 8,
+    client: httpx.AsyncClient = Depends(get_client)
+):
+    """Obtener cartas relacionadas para 'Traders Also Watch'"""
+    try:
+        # Primero obtener la carta original
+        card_response = await client.get(f"/cards/{card_id}")
+        
+        raise_for_upstream(card_response)
+        if card_response.status_code != 200:
+            raise HTTPException(status_code=404, detail="Card not found")
+        
+        card = orjson.loads(card_response.content)['data']
+        related = []
+        
+        # 1. Mismo Pokemon, diferentes sets
+        name_query = f'name:"{card["name"]}" -id:{card_id}'
+        queries = [fetch_optional(client, "/cards", params={'q': name_query, 'pageSize': 3})]
+        
+        # 2. Mismo set, rareza similar
+        if 'set' in card and 'rarity' in card:
+            set_query = f'set.id:{card["set"]["id"]} rarity:"{card["rarity"]}" -id:{card_id}'
+            queries.append(fetch_optional(client, "/cards", params={'q': set_query, 'pageSize': 2}))
+        
+        # Lanzar ambas consultas en paralelo
+        responses = await asyncio.gather(*queries)
+        
+        for response, max_cards in zip(responses, (3, 2)):
+            if response is not None and response.status_code == 200:
+                for related_card in orjson.loads(response.content)['data'][:max_cards]:
+                    related.append(format_related_card(related_card))
+        
+        # Eliminar duplicados
+        seen = set()
+        unique_related = []
+        for card in related:
+            if card['id'] not in seen:
+                seen.add(card['id'])
+                unique_related.append(card)
+                if len(unique_related) >= limit:
+                    break
+        
+        return {
+            "success": True,
+            "data": unique_related
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,81 @@
+"""
+Endpoint de búsqueda de cartas
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+import httpx
+import orjson
+
+from ..dependencies import get_client
+from ..enrichment import extract_market_price, calculate_pull_rate, calculate_trend
+
+router = APIRouter()
+
+
+@router.get("/api/search")
+async def search_cards(
+    q: str,
+    page: int = 1,
+    pageSize: int = 20,
+    orderBy: Optional[str] = None,
+    fields: Optional[str] = None,
+    enrich: bool = True,
+    client: httpx.AsyncClient = Depends(get_client)
+):
+    """
+    Buscar cartas
+    Ejemplos de query:
+    - name:charizard
+    - set.name:base
+    - rarity:Rare Secret
+    
+    Para vistas de lista:
+    - enrich=false omite market_price, pull_rate y price_trend
+    - fields=id,name,images devuelve solo esos campos de cada carta
+    """
+    try:
+        params = {
+            'q': q,
+            'page': page,
+            'pageSize': pageSize
+        }
+        if orderBy:
+            params['orderBy'] = orderBy
+        
+        response = await client.get(
+            "/cards",
+            params=params
+        )
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            
+            # Procesar y enriquecer datos
+            cards = data.get('data', [])
+            if enrich:
+                for card in cards:
+                    # Añadir datos calculados
+                    card['market_price'] = extract_market_price(card)
+                    card['pull_rate'] = calculate_pull_rate(card)
+                    card['price_trend'] = calculate_trend(card)
+            
+            # Quedarse solo con los campos pedidos
+            if fields:
+                # dict.fromkeys quita duplicados manteniendo el orden pedido
+                field_list = list(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+                cards = [{k: card[k] for k in field_list if k in card} for card in cards]
+            
+            return {
+                "success": True,
+                "data": cards,
+                "page": page,
+                "pageSize": pageSize,
+                "count": data.get('count', 0),
+                "totalCount": data.get('totalCount', 0)
+            }
+        else:
+            raise HTTPException(status_code=response.status_code, detail="Error fetching data")
+            
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
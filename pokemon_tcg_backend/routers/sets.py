@@ -0,0 +1,185 @@
+"""
+Endpoints de sets y análisis de mercado por set
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, List, Tuple
+import anyio
+import httpx
+import orjson
+import numpy as np
+import redis.asyncio as redis
+
+from ..cache import cached
+from ..dependencies import get_client, get_redis
+from ..enrichment import extract_market_price, calculate_pull_rate, calculate_set_rating
+from ..upstream import fetch_set_cards, raise_for_upstream
+
+# A partir de cuántas cartas la agregación se saca del event loop
+AGGREGATE_IN_THREAD_MIN_CARDS = 1000
+
+router = APIRouter()
+
+
+@router.get("/api/sets")
+async def get_all_sets(
+    response: Response,
+    page: int = 1,
+    pageSize: int = 20,
+    client: httpx.AsyncClient = Depends(get_client),
+    redis_client: redis.Redis = Depends(get_redis)
+):
+    """Obtener todos los sets"""
+    try:
+        async def fetch_sets():
+            sets_response = await client.get(
+                "/sets",
+                params={'page': page, 'pageSize': pageSize, 'orderBy': '-releaseDate'}
+            )
+            
+            if sets_response.status_code == 200:
+                data = orjson.loads(sets_response.content)
+                
+                # Enriquecer con datos de trending
+                sets = data['data']
+                for set_item in sets:
+                    # En producción, estos datos vendrían de análisis real
+                    set_item['trending'] = {
+                        'total_value_change': 8.5,  # Simulado
+                        'hot_cards_count': 3,
+                        'average_pull_rate': 2.5
+                    }
+                
+                return {
+                    "success": True,
+                    "data": sets,
+                    "page": page,
+                    "totalCount": data.get('totalCount', 0)
+                }
+            
+            raise_for_upstream(sets_response)
+            raise HTTPException(status_code=sets_response.status_code, detail="Error fetching sets")
+        
+        data, cache_status = await cached(redis_client, f"sets:{page}:{pageSize}", 86400, fetch_sets)
+        response.headers['X-Cache'] = cache_status
+        return data
+            
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/set/{set_id}")
+async def get_set_detail(
+    set_id: str,
+    client: httpx.AsyncClient = Depends(get_client),
+    redis_client: redis.Redis = Depends(get_redis)
+):
+    """Obtener detalles de un set con análisis de mercado"""
+    try:
+        async def fetch_set():
+            # Obtener info del set
+            set_response = await client.get(f"/sets/{set_id}")
+            
+            raise_for_upstream(set_response)
+            if set_response.status_code != 200:
+                raise HTTPException(status_code=404, detail="Set not found")
+            
+            set_data = orjson.loads(set_response.content)['data']
+            
+            # Obtener todas las cartas del set para análisis
+            cards = await fetch_set_cards(client, set_id)
+            
+            # Con sets muy grandes la agregación bloquearía el event loop:
+            # en ese caso se ejecuta en el threadpool
+            if len(cards) >= AGGREGATE_IN_THREAD_MIN_CARDS:
+                total_value, chase_cards, rarity_distribution = await anyio.to_thread.run_sync(_aggregate, cards)
+            else:
+                total_value, chase_cards, rarity_distribution = _aggregate(cards)
+            
+            return {
+                "success": True,
+                "data": {
+                    **set_data,
+                    "market_analysis": {
+                        "total_set_value": round(total_value, 2),
+                        "average_card_value": round(total_value / set_data['total'], 2) if set_data['total'] > 0 else 0,
+                        "chase_cards": chase_cards[:10],
+                        "rarity_distribution": rarity_distribution,
+                        "investment_rating": calculate_set_rating(total_value, set_data['total'])
+                    }
+                }
+            }
+        
+        data, cache_status = await cached(redis_client, f"set:{set_id}", 3600, fetch_set)
+        
+        # Enviar la respuesta por trozos para que el cliente reciba antes el primer byte
+        return StreamingResponse(
+            stream_set_detail(data),
+            media_type="application/json",
+            headers={'X-Cache': cache_status}
+        )
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _aggregate(cards: List[Dict]) -> Tuple[float, List[Dict], Dict[str, int]]:
+    """Calcula valor total, chase cards (ordenadas por precio) y distribución de rareza"""
+    # Precios de todas las cartas en un array para operar vectorizado
+    prices = np.fromiter(
+        (extract_market_price(card) for card in cards),
+        dtype=np.float64,
+        count=len(cards)
+    )
+    total_value = float(prices.sum())
+    
+    # Identificar chase cards (>$30)
+    chase_cards = []
+    for i in np.flatnonzero(prices > 30):
+        card = cards[i]
+        chase_cards.append({
+            'id': card['id'],
+            'name': card['name'],
+            'image': card['images']['small'],
+            'market_price': float(prices[i]),
+            'rarity': card.get('rarity'),
+            'pull_rate': calculate_pull_rate(card)
+        })
+    
+    # Distribución de rareza
+    rarity_distribution = {}
+    if cards:
+        rarities = np.array([card.get('rarity', 'Unknown') for card in cards])
+        values, counts = np.unique(rarities, return_counts=True)
+        rarity_distribution = dict(zip(values.tolist(), counts.tolist()))
+    
+    # Ordenar chase cards por precio
+    chase_cards.sort(key=lambda x: x['market_price'], reverse=True)
+    
+    return total_value, chase_cards, rarity_distribution
+
+
+async def stream_set_detail(payload: Dict) -> AsyncIterator[bytes]:
+    """
+    Serializa la respuesta de /api/set/{id} por trozos:
+    primero los datos del set y el análisis, luego las chase cards una a una
+    """
+    set_detail = dict(payload['data'])
+    analysis = dict(set_detail.pop('market_analysis'))
+    chase_cards = analysis.pop('chase_cards')
+    
+    yield (
+        b'{"success":true,"data":' + _open_object(set_detail)
+        + b'"market_analysis":' + _open_object(analysis)
+        + b'"chase_cards":['
+    )
+    for i, card in enumerate(chase_cards):
+        yield (b',' if i else b'') + orjson.dumps(card)
+    yield b']}}}'
+
+
+def _open_object(data: Dict) -> bytes:
+    """JSON de un dict sin la llave de cierre, listo para añadirle más claves"""
+    raw = orjson.dumps(data)[:-1]
+    return raw + b',' if data else raw
@@ -0,0 +1,107 @@
+"""
+Endpoint de cartas trending
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from datetime import datetime
+import asyncio
+import httpx
+import orjson
+import redis.asyncio as redis
+
+from ..cache import cached
+from ..dependencies import get_client, get_redis
+from ..enrichment import extract_market_price, calculate_pull_rate
+from ..upstream import UpstreamError, fetch_optional
+
+router = APIRouter()
+
+
+@router.get("/api/trending")
+async def get_trending_cards(
+    response: Response,
+    client: httpx.AsyncClient = Depends(get_client),
+    redis_client: redis.Redis = Depends(get_redis)
+):
+    """
+    Obtener cartas trending (hot & cold)
+    En producción, esto vendría de una base de datos con histórico de precios
+    """
+    try:
+        async def fetch_trending():
+            # Por ahora, simulamos con cartas de alta rareza (hot) y comunes (cold)
+            
+            # Hot cards - Cartas secretas y ultra raras
+            hot_params = {
+                'q': 'rarity:"Rare Secret" OR rarity:"Hyper Rare"',
+                'page': 1,
+                'pageSize': 5,
+                'orderBy': '-set.releaseDate'
+            }
+            
+            # Cold cards - Para simular, usamos cartas comunes recientes
+            cold_params = {
+                'q': 'rarity:"Rare"',
+                'page': 1,
+                'pageSize': 5,
+                'orderBy': 'set.releaseDate'
+            }
+            
+            # Lanzar ambas peticiones en paralelo
+            hot_response, cold_response = await asyncio.gather(
+                fetch_optional(client, "/cards", params=hot_params),
+                fetch_optional(client, "/cards", params=cold_params)
+            )
+            
+            # Si fallan las dos consultas no hay nada que cachear: mejor usar la copia stale
+            hot_ok = hot_response is not None and hot_response.status_code == 200
+            cold_ok = cold_response is not None and cold_response.status_code == 200
+            if not hot_ok and not cold_ok:
+                raise UpstreamError("Trending queries failed")
+            
+            hot_cards = []
+            cold_cards = []
+            
+            if hot_ok:
+                for card in orjson.loads(hot_response.content)['data']:
+                    hot_cards.append({
+                        'id': card['id'],
+                        'name': card['name'],
+                        'image': card['images']['small'],
+                        'set': card['set']['name'],
+                        'rarity': card.get('rarity'),
+                        'market_price': extract_market_price(card),
+                        'price_change': 15.5,  # Simulado, en producción vendría de BD
+                        'price_change_percent': 12.3,  # Simulado
+                        'pull_rate': calculate_pull_rate(card)
+                    })
+            
+            if cold_ok:
+                for card in orjson.loads(cold_response.content)['data']:
+                    cold_cards.append({
+                        'id': card['id'],
+                        'name': card['name'],
+                        'image': card['images']['small'],
+                        'set': card['set']['name'],
+                        'rarity': card.get('rarity'),
+                        'market_price': extract_market_price(card),
+                        'price_change': -5.2,  # Simulado
+                        'price_change_percent': -8.7,  # Simulado
+                        'pull_rate': calculate_pull_rate(card)
+                    })
+            
+            return {
+                "success": True,
+                "data": {
+                    "hot_cards": hot_cards,
+                    "cold_cards": cold_cards,
+                    "last_updated": datetime.now().isoformat()
+                }
+            }
+        
+        data, cache_status = await cached(redis_client, "trending", 300, fetch_trending)
+        response.headers['X-Cache'] = cache_status
+        return data
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
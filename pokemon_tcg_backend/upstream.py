@@ -0,0 +1,142 @@
+"""
+Helpers para llamar a la API de Pokemon TCG
+"""
+
+from aiolimiter import AsyncLimiter
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+from typing import Optional, List, Dict
+import asyncio
+import httpx
+import math
+import orjson
+import time
+
+# Respuestas que merece la pena reintentar (rate limit o gateway caído)
+RETRY_STATUS_CODES = {429, 502, 503}
+MAX_RETRY_WAIT = 4  # segundos
+# Si quedan menos peticiones que esto en la ventana, frenar un poco
+RATE_LIMIT_LOW_WATERMARK = 2
+
+
+class UpstreamError(Exception):
+    """La API de Pokemon TCG ha devuelto un 5xx o nos ha limitado (429)"""
+
+
+def raise_for_upstream(response: httpx.Response) -> None:
+    """
+    Lanza UpstreamError si la respuesta es un fallo de la API (429 o 5xx)
+    Así el cache puede servir la copia stale en vez de un error
+    """
+    if response.status_code == 429 or response.status_code >= 500:
+        raise UpstreamError(f"API returned {response.status_code}")
+
+
+class UpstreamTransport(httpx.AsyncBaseTransport):
+    """
+    Transport que envuelve al real para proteger la API de Pokemon TCG:
+    limita las peticiones por segundo y reintenta 429/502/503 con backoff
+    exponencial, respetando Retry-After y X-RateLimit-Remaining
+    """
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_rate: float = 20, time_period: float = 1):
+        self._transport = transport
+        self._limiter = AsyncLimiter(max_rate, time_period)
+        self._paused_until = 0.0
+        self._backoff = wait_exponential_jitter(initial=0.25, max=MAX_RETRY_WAIT)
+        self._retrying = AsyncRetrying(
+            stop=stop_after_attempt(4),
+            wait=self._wait,
+            retry=(
+                retry_if_result(lambda response: response.status_code in RETRY_STATUS_CODES)
+                | retry_if_exception_type((httpx.ConnectError, httpx.ConnectTimeout))
+            ),
+            before_sleep=self._discard_response,
+            # Si se agotan los reintentos, devolver la última respuesta tal cual
+            retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._retrying(self._send, request)
+    
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+    
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        # La API avisó de que estamos al límite: esperar antes de seguir
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        
+        async with self._limiter:
+            response = await self._transport.handle_async_request(request)
+        
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit() and int(remaining) <= RATE_LIMIT_LOW_WATERMARK:
+            self._paused_until = time.monotonic() + 1
+        return response
+    
+    def _wait(self, retry_state) -> float:
+        """Usa Retry-After si la API lo manda; si no, backoff exponencial con jitter"""
+        outcome = retry_state.outcome
+        if outcome is not None and not outcome.failed:
+            retry_after = outcome.result().headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), MAX_RETRY_WAIT)
+        return self._backoff(retry_state)
+    
+    async def _discard_response(self, retry_state) -> None:
+        """Cierra la respuesta descartada antes de reintentar para liberar la conexión"""
+        outcome = retry_state.outcome
+        if outcome is not None and not outcome.failed:
+            await outcome.result().aclose()
+
+
+async def fetch_optional(client: httpx.AsyncClient, path: str, params: Optional[Dict] = None) -> Optional[httpx.Response]:
+    """GET que devuelve None si falla la red, para que un fallo parcial no tumbe el endpoint"""
+    try:
+        return await client.get(path, params=params)
+    except httpx.HTTPError:
+        return None
+
+
+async def fetch_set_cards(client: httpx.AsyncClient, set_id: str) -> List[Dict]:
+    """
+    Obtiene todas las cartas de un set
+    La primera página da el totalCount; el resto se piden en paralelo
+    """
+    page_size = 250
+    params = {'q': f'set.id:{set_id}', 'pageSize': page_size}
+    
+    first = await client.get("/cards", params={**params, 'page': 1})
+    # Solo un 404 significa "sin cartas"; cualquier otro error aborta para no
+    # cachear un set incompleto (y que se use la copia stale)
+    if first.status_code == 404:
+        return []
+    if first.status_code != 200:
+        raise UpstreamError(f"API returned {first.status_code}")
+    
+    data = orjson.loads(first.content)
+    cards = data['data']
+    pages = math.ceil(data.get('totalCount', 0) / page_size)
+    
+    # Máximo 8 peticiones simultáneas para no saturar la API
+    semaphore = asyncio.Semaphore(8)
+    
+    async def fetch_page(page: int) -> List[Dict]:
+        async with semaphore:
+            response = await client.get("/cards", params={**params, 'page': page})
+        if response.status_code != 200:
+            raise UpstreamError(f"API returned {response.status_code}")
+        return orjson.loads(response.content)['data']
+    
+    results = await asyncio.gather(*(fetch_page(page) for page in range(2, pages + 1)))
+    for page_cards in results:
+        cards.extend(page_cards)
+    
+    return cards